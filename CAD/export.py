@@ -15,13 +15,30 @@ Available subcommands:
 
 import os
 import csv
+import math
+import re
 import json
 import subprocess
+import shutil
+import tempfile
 import argparse
+import logging
 import sys
-import concurrent.futures
+import asyncio
+import functools
 import time
 
+try:
+    import orjson  # Optional, much faster JSON serialization
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Decimal or scientific notation number, checked before calling float() so that
+# plain strings don't pay for a raised ValueError
+NUMERIC_PATTERN = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
 
 def parse_arguments():
     """
@@ -86,6 +103,11 @@ def parse_arguments():
         action="store_true",
         help="Disable parallel processing and export sequentially.",
     )
+    export_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log the OpenSCAD command line of every export.",
+    )
 
     # csv2json subcommand
     csv2json_parser = subparsers.add_parser(
@@ -116,12 +138,28 @@ def read_csv(csv_path):
     Args:
         csv_path (str): Path to the CSV file.
 
+    Rows are handled like csv.DictReader does: short rows map the missing columns to
+    None and extra cells are collected in a list under the None key.
+
     Returns:
         list of dict: List of parameter dictionaries.
     """
     with open(csv_path, newline="") as csvfile:
-        reader = csv.DictReader(csvfile)
-        parameters = [row for row in reader]
+        reader = csv.reader(csvfile)
+        # Interned header names are shared as keys by every row dict
+        fieldnames = [sys.intern(name) for name in next(reader, [])]
+        num_fields = len(fieldnames)
+        parameters = []
+        for row in reader:
+            if not row:
+                continue
+            params = dict(zip(fieldnames, row))
+            if len(row) > num_fields:
+                params[None] = row[num_fields:]
+            elif len(row) < num_fields:
+                for name in fieldnames[len(row) :]:
+                    params[name] = None
+            parameters.append(params)
     return parameters
 
 
@@ -135,7 +173,9 @@ def read_json(json_path):
     Returns:
         list of dict: List of parameter dictionaries with 'exported_filename' added.
     """
-    with open(json_path, "r") as jsonfile:
+    # Stdlib json on purpose: orjson turns integers beyond 64 bits into floats and
+    # rejects the NaN/Infinity literals that json accepts
+    with open(json_path, "r", encoding="utf-8") as jsonfile:
         data = json.load(jsonfile)
         parameter_sets = data.get("parameterSets", {})
         parameters = []
@@ -153,20 +193,38 @@ def ensure_output_folder(folder):
     Args:
         folder (str): Path to the output folder.
     """
-    if not os.path.exists(folder):
-        os.makedirs(folder)
+    os.makedirs(folder, exist_ok=True)
+
+
+def check_index_range(indices, total_params):
+    """
+    Check that every index in a range refers to an existing parameter set.
+
+    Args:
+        indices (range): Range of selected indices.
+        total_params (int): Total number of parameter sets.
+
+    Raises:
+        ValueError: If the range contains an index out of bounds.
+    """
+    if not indices:
+        return
+    # A range is bounded by its first and last element
+    for i in (indices[0], indices[-1]):
+        if i < 0 or i >= total_params:
+            raise ValueError(f"Index {i} out of range (0-{total_params -1}).")
 
 
 def parse_selection(selection_str, total_params):
     """
-    Parse a selection string and return a sorted list of unique indices.
+    Parse a selection string and return the set of unique selected indices.
 
     Args:
         selection_str (str): Selection string (e.g., "0-5,7,10-12, every:2 in 0-10, from:15, up_to:20").
         total_params (int): Total number of parameter sets.
 
     Returns:
-        list of int: Sorted list of unique selected indices.
+        frozenset of int: Unique selected indices.
 
     Raises:
         ValueError: If the selection string is invalid.
@@ -185,12 +243,9 @@ def parse_selection(selection_str, total_params):
                 start, end = map(int, range_part.split("-"))
                 if start > end:
                     raise ValueError(f"Invalid range '{range_part}': start > end.")
-                for i in range(start, end + 1, step):
-                    if i < 0 or i >= total_params:
-                        raise ValueError(
-                            f"Index {i} out of range (0-{total_params -1})."
-                        )
-                    selected_indices.add(i)
+                indices = range(start, end + 1, step)
+                check_index_range(indices, total_params)
+                selected_indices.update(indices)
             except ValueError as ve:
                 raise ValueError(f"Invalid step selection '{part}': {ve}")
         elif part.startswith("from:"):
@@ -201,8 +256,7 @@ def parse_selection(selection_str, total_params):
                     raise ValueError(
                         f"Start index {start} out of range (0-{total_params -1})."
                     )
-                for i in range(start, total_params):
-                    selected_indices.add(i)
+                selected_indices.update(range(start, total_params))
             except ValueError as ve:
                 raise ValueError(f"Invalid 'from' selection '{part}': {ve}")
         elif part.startswith("up_to:"):
@@ -213,8 +267,7 @@ def parse_selection(selection_str, total_params):
                     raise ValueError(
                         f"End index {end} out of range (0-{total_params -1})."
                     )
-                for i in range(0, end + 1):
-                    selected_indices.add(i)
+                selected_indices.update(range(0, end + 1))
             except ValueError as ve:
                 raise ValueError(f"Invalid 'up_to' selection '{part}': {ve}")
         elif "-" in part:
@@ -222,12 +275,9 @@ def parse_selection(selection_str, total_params):
                 start, end = map(int, part.split("-"))
                 if start > end:
                     raise ValueError(f"Invalid range '{part}': start > end.")
-                for i in range(start, end + 1):
-                    if i < 0 or i >= total_params:
-                        raise ValueError(
-                            f"Index {i} out of range (0-{total_params -1})."
-                        )
-                    selected_indices.add(i)
+                indices = range(start, end + 1)
+                check_index_range(indices, total_params)
+                selected_indices.update(indices)
             except ValueError as ve:
                 raise ValueError(f"Invalid range '{part}': {ve}")
         else:
@@ -240,61 +290,170 @@ def parse_selection(selection_str, total_params):
                 selected_indices.add(index)
             except ValueError as ve:
                 raise ValueError(f"Invalid index '{part}': {ve}")
-    return sorted(selected_indices)
+    return frozenset(selected_indices)
+
+
+def format_d_flag(key, value):
+    """
+    Construct a single -D flag for OpenSCAD from a parameter key and value.
+
+    Args:
+        key (str): Parameter name.
+        value: Parameter value.
+
+    Returns:
+        str: The -D flag.
+    """
+    if isinstance(value, bool):
+        # Booleans should be lowercased and not quoted
+        return f"-D{key}={'true' if value else 'false'}"
+    elif isinstance(value, (int, float)):
+        # Numbers are passed as is
+        return f"-D{key}={value}"
+    elif isinstance(value, str):
+        lowered = value.lower()
+        if lowered == "true":
+            return f"-D{key}=true"
+        elif lowered == "false":
+            return f"-D{key}=false"
+        # Check if the string represents an array or object
+        stripped_value = value.strip()
+        if (stripped_value.startswith("[") and stripped_value.endswith("]")) or (
+            stripped_value.startswith("{") and stripped_value.endswith("}")
+        ):
+            # Pass arrays and objects as is
+            return f"-D{key}={value}"
+        if NUMERIC_PATTERN.fullmatch(stripped_value):
+            numeric_value = float(stripped_value)
+            if numeric_value.is_integer():
+                numeric_value = int(numeric_value)
+            return f"-D{key}={numeric_value}"
+        # It's a string, wrap it in quotes
+        return f'-D{key}=\"{value}\"'
+    # Default to string
+    return f'-D{key}=\"{value}\"'
+
+
+def build_d_flag_formatters(parameters):
+    """
+    Build a cached -D flag formatter for every parameter column.
 
+    Parameter sweeps share the same columns across all rows and typically repeat the
+    same values, so each column gets its own formatter that only does the type
+    dispatch once per distinct value.
+
+    Args:
+        parameters (list of dict): List of parameter dictionaries.
 
-def construct_d_flags(params):
+    Returns:
+        dict: Mapping of parameter name to a callable turning a value into a -D flag.
+    """
+    keys = set()
+    for params in parameters:
+        keys.update(params.keys())
+    keys.discard("exported_filename")
+    # typed=True keeps True and 1 (which hash equal) from sharing a cache entry
+    return {
+        key: functools.lru_cache(maxsize=None, typed=True)(
+            functools.partial(format_d_flag, key)
+        )
+        for key in keys
+    }
+
+
+def construct_d_flags(params, formatters=None):
     """
     Construct a list of -D flags for OpenSCAD based on parameters.
 
     Args:
         params (dict): Dictionary of parameters.
+        formatters (dict or None): Per-column formatters from build_d_flag_formatters.
 
     Returns:
         list of str: List of -D flags.
     """
+    if formatters is None:
+        return [
+            format_d_flag(key, value)
+            for key, value in params.items()
+            if key != "exported_filename"
+        ]
     d_flags = []
     for key, value in params.items():
         if key != "exported_filename":
-            if isinstance(value, bool):
-                # Booleans should be lowercased and not quoted
-                d_flags.append(f"-D{key}={'true' if value else 'false'}")
-            elif isinstance(value, (int, float)):
-                # Numbers are passed as is
-                d_flags.append(f"-D{key}={value}")
-            elif isinstance(value, str):
-                lowered = value.lower()
-                if lowered == "true":
-                    d_flags.append(f"-D{key}=true")
-                elif lowered == "false":
-                    d_flags.append(f"-D{key}=false")
-                else:
-                    # Check if the string represents an array or object
-                    stripped_value = value.strip()
-                    if (
-                        stripped_value.startswith("[") and stripped_value.endswith("]")
-                    ) or (
-                        stripped_value.startswith("{") and stripped_value.endswith("}")
-                    ):
-                        # Pass arrays and objects as is
-                        d_flags.append(f"-D{key}={value}")
-                    else:
-                        # Attempt to convert to float
-                        try:
-                            numeric_value = float(value)
-                            if numeric_value.is_integer():
-                                numeric_value = int(numeric_value)
-                            d_flags.append(f"-D{key}={numeric_value}")
-                        except ValueError:
-                            # It's a string, wrap it in quotes
-                            d_flags.append(f'-D{key}=\"{value}\"')
-            else:
-                # Default to string
-                d_flags.append(f'-D{key}=\"{value}\"')
+            try:
+                d_flags.append(formatters[key](value))
+            except TypeError:
+                # Unhashable values (e.g. JSON lists) bypass the cache
+                d_flags.append(format_d_flag(key, value))
     return d_flags
 
 
-def export_file(openscad_path, scad_file, output_file, export_format, d_flags):
+def write_params_file(d_flags):
+    """
+    Write -D flags as OpenSCAD assignments to a new temporary .scad file.
+
+    Every call creates its own file, so tasks sharing an output name can't
+    overwrite each other's parameters.
+
+    Args:
+        d_flags (list of str): List of -D flags for OpenSCAD.
+
+    Returns:
+        str: Path of the written .scad file.
+    """
+    fd, params_file = tempfile.mkstemp(suffix=".scad")
+    try:
+        with os.fdopen(fd, "w") as f:
+            for flag in d_flags:
+                # "-Dkey=value" becomes "key=value;"
+                f.write(f"{flag[2:]};\n")
+    except BaseException:
+        os.remove(params_file)
+        raise
+    return params_file
+
+
+def build_export_command(openscad_path, scad_file, output_file, d_flags):
+    """
+    Build the OpenSCAD command line for a single export.
+
+    The parameters are written to a temporary sidecar .scad file and included through
+    a single -D flag, keeping the command line short no matter how many parameters
+    there are. The caller removes the sidecar once OpenSCAD finishes.
+
+    Args:
+        openscad_path (str): Path to the OpenSCAD executable.
+        scad_file (str): Path to the OpenSCAD (.scad) file.
+        output_file (str): Path where the file will be saved.
+        d_flags (list of str): List of -D flags for OpenSCAD.
+
+    Returns:
+        tuple:
+            list of str: The command line.
+            str or None: Path of the sidecar parameter file, if one was written.
+    """
+    params_file = None
+    command = [
+        openscad_path,
+        "-o",
+        output_file,
+        #,
+    ]
+    if d_flags:
+        params_file = write_params_file(d_flags)
+        # Included last, so these assignments override the defaults in scad_file
+        include_path = os.path.abspath(params_file).replace(os.sep, "/")
+        command.append(f"-Dinclude<{include_path}>")
+    command.append(scad_file)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running command: %s", " ".join(command))
+        # The sidecar is deleted after the render, so log what it contains
+        logger.debug("Parameters: %s", " ".join(d_flags))
+    return command, params_file
+
+
+async def export_file(openscad_path, scad_file, output_file, d_flags):
     """
     Export an file using OpenSCAD with the specified parameters.
 
@@ -302,7 +461,6 @@ def export_file(openscad_path, scad_file, output_file, export_format, d_flags):
         openscad_path (str): Path to the OpenSCAD executable.
         scad_file (str): Path to the OpenSCAD (.scad) file.
         output_file (str): Path where the file will be saved.
-        export_format (str): Export format ('asciistl' or 'binstl').
         d_flags (list of str): List of -D flags for OpenSCAD.
 
     Returns:
@@ -312,30 +470,116 @@ def export_file(openscad_path, scad_file, output_file, export_format, d_flags):
             float: Duration of the export process in seconds.
     """
     start_time = time.perf_counter()
-    exportformat = f"--export-format={export_format}"
-    command = (
-        [
-            openscad_path,
-            "-o",
-            output_file,
-            #,
-        ]
-        + d_flags
-        + [scad_file]
+    command, params_file = build_export_command(
+        openscad_path, scad_file, output_file, d_flags
     )
-    print(f"Running command: {' '.join(command)}")  # Debug print
     try:
-        subprocess.run(
-            command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        # close_fds=False (safe, since Python creates fds non-inheritable) lets
+        # subprocess launch OpenSCAD via posix_spawn instead of fork + exec.
+        # Only stderr is reported on failure, so stdout is discarded.
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,
         )
+        _, stderr = await proc.communicate()
         end_time = time.perf_counter()
         duration = end_time - start_time
+        if proc.returncode != 0:
+            return False, stderr.decode().strip(), duration
         return True, "", duration
-    except subprocess.CalledProcessError as e:
-        error_message = e.stderr.decode().strip()
-        end_time = time.perf_counter()
-        duration = end_time - start_time
-        return False, error_message, duration
+    finally:
+        if params_file is not None:
+            try:
+                os.remove(params_file)
+            except FileNotFoundError:
+                pass
+
+
+def export_target(idx_param, output_prefix, output_suffix, formatters):
+    """
+    Determine the output file and -D flags for a single export task.
+
+    Args:
+        idx_param (tuple): Tuple containing index and parameter set.
+        output_prefix (str): Output folder path, ending in a path separator.
+        output_suffix (str): Output file extension, including the leading dot.
+        formatters (dict): Per-column formatters from build_d_flag_formatters.
+
+    Returns:
+        tuple:
+            str: Path where the file will be saved.
+            list of str: List of -D flags for OpenSCAD.
+    """
+    idx, param_set = idx_param
+    filename = param_set.get("exported_filename", f"model_{idx}")
+    output_file = f"{output_prefix}{filename}{output_suffix}"
+    return output_file, construct_d_flags(param_set, formatters)
+
+
+async def process_export(
+    idx_param,
+    output_prefix,
+    output_suffix,
+    openscad_path,
+    scad_file,
+    formatters,
+):
+    """
+    Process a single export task.
+
+    Args:
+        idx_param (tuple): Tuple containing index and parameter set.
+        output_prefix (str): Output folder path, ending in a path separator.
+        output_suffix (str): Output file extension, including the leading dot.
+        openscad_path (str): Path to the OpenSCAD executable.
+        scad_file (str): Path to the OpenSCAD (.scad) file.
+        formatters (dict): Per-column formatters from build_d_flag_formatters.
+
+    Returns:
+        tuple: Result of the export process.
+    """
+    output_file, d_flags = export_target(
+        idx_param, output_prefix, output_suffix, formatters
+    )
+
+    # Export STL using OpenSCAD with -D flags
+    success, error, duration = await export_file(
+        openscad_path, scad_file, output_file, d_flags
+    )
+    if success:
+        return ("success", output_file, duration)
+    else:
+        return ("failure", (output_file, error), duration)
+
+
+async def batch_export_async(work, on_result, max_workers, **export_args):
+    """
+    Run the export tasks with at most max_workers OpenSCAD processes at a time.
+
+    Args:
+        work (list of tuple): Index and parameter set of every task to export.
+        on_result (callable): Called with each result as soon as its task finishes.
+        max_workers (int): Maximum number of concurrent exports.
+        **export_args: Keyword arguments passed on to process_export.
+    """
+    # Workers pull tasks from a shared iterator, so only in-flight tasks are held
+    # in memory
+    pending = iter(work)
+
+    async def worker():
+        for idx_param in pending:
+            on_result(await process_export(idx_param, **export_args))
+
+    workers = min(max_workers, len(work))
+    results = await asyncio.gather(
+        *(worker() for _ in range(workers)), return_exceptions=True
+    )
+    # Let every render finish before surfacing the first unexpected error
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
 
 def batch_export(
@@ -374,103 +618,63 @@ def batch_export(
 
     ensure_output_folder(output_folder)
 
+    # Resolve the executable once; posix_spawn is only used for explicit paths
+    openscad_path = shutil.which(openscad_path) or openscad_path
+
     total_params = len(parameters)
     selected_indices = None
     if selection:
         try:
             selected_indices = parse_selection(selection, total_params)
-            print(f"Selected parameter set indices: {selected_indices}")
+            print(f"Selected parameter set indices: {sorted(selected_indices)}")
         except ValueError as ve:
             print(f"Selection parsing error: {ve}")
             sys.exit(1)
 
+    # Only the selected parameter sets become export tasks
+    if selected_indices is not None:
+        work = [(idx, parameters[idx]) for idx in sorted(selected_indices)]
+    else:
+        work = list(enumerate(parameters))
+
     successes = []
     failures = []
-    export_times = []
     total_start_time = time.perf_counter()
 
-    def process_export(idx_param):
+    export_args = dict(
+        formatters=build_d_flag_formatters(parameters),
+        # Joined once here instead of with os.path.join for every export
+        output_prefix=os.path.join(output_folder, ""),
+        output_suffix=f".{export_extension}",
+        openscad_path=openscad_path,
+        scad_file=scad_file,
+    )
+
+    def record_result(result):
         """
-        Helper function to process a single export task.
+        Record and report the result of a single export task.
 
         Args:
-            idx_param (tuple): Tuple containing index and parameter set.
-
-        Returns:
-            tuple or None: Result of the export process or None if skipped.
+            result (tuple): Result of the export process.
         """
-        idx, param_set = idx_param
-        if selected_indices is not None and idx not in selected_indices:
-            return None  # Skip non-selected parameter sets
-
-        filename = param_set.get("exported_filename", f"model_{idx}")
-        output_file = os.path.join(output_folder, f"{filename}.{export_extension}")
-
-        # Construct -D flags
-        d_flags = construct_d_flags(param_set)
-
-        # Export STL using OpenSCAD with -D flags
-        success, error, duration = export_file(
-            openscad_path, scad_file, output_file, export_format, d_flags
-        )
-        if success:
-            return ("success", output_file, duration)
-        else:
-            return ("failure", (output_file, error), duration)
+        status, info, duration = result
+        if status == "success":
+            successes.append(info)
+            print(f"Exported: {info} in {duration:.2f} seconds.")
+        elif status == "failure":
+            failures.append(info)
+            print(
+                f"Error exporting {info[0]}: {info[1]} (Time: {duration:.2f} seconds)"
+            )
 
     if sequential:
         print("Running exports sequentially.")
-        for idx, param_set in enumerate(parameters):
-            if selected_indices is not None and idx not in selected_indices:
-                continue  # Skip non-selected parameter sets
-
-            filename = param_set.get("exported_filename", f"model_{idx}")
-            output_file = os.path.join(output_folder, f"{filename}.{export_extension}")
-
-            # Construct -D flags
-            d_flags = construct_d_flags(param_set)
-
-            # Export STL using OpenSCAD with -D flags
-            success, error, duration = export_file(
-                openscad_path, scad_file, output_file, export_format, d_flags
-            )
-            if success:
-                successes.append(output_file)
-                export_times.append(duration)
-                print(f"Exported: {output_file} in {duration:.2f} seconds.")
-            else:
-                failures.append((output_file, error))
-                export_times.append(duration)
-                print(
-                    f"Error exporting {output_file}: {error} (Time: {duration:.2f} seconds)"
-                )
+        max_workers = 1
     else:
         print("Running exports in parallel.")
-        # Use ThreadPoolExecutor for I/O-bound operations
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            # Prepare iterable of (index, param_set)
-            iterable = enumerate(parameters)
-            # Submit all tasks
-            future_to_export = {
-                executor.submit(process_export, idx_param): idx_param
-                for idx_param in iterable
-            }
-
-            for future in concurrent.futures.as_completed(future_to_export):
-                result = future.result()
-                if result is None:
-                    continue  # Skipped parameter set
-                status, info, duration = result
-                if status == "success":
-                    successes.append(info)
-                    export_times.append(duration)
-                    print(f"Exported: {info} in {duration:.2f} seconds.")
-                elif status == "failure":
-                    failures.append(info)
-                    export_times.append(duration)
-                    print(
-                        f"Error exporting {info[0]}: {info[1]} (Time: {duration:.2f} seconds)"
-                    )
+        # Each OpenSCAD render saturates a core, so run one export per CPU
+        max_workers = os.cpu_count() or 1
+    asyncio.run(batch_export_async(work, record_result, max_workers, **export_args))
 
     total_end_time = time.perf_counter()
     total_duration = total_end_time - total_start_time
@@ -501,10 +705,8 @@ def csv_to_json(csv_file, json_file):
     """
     parameters = read_csv(csv_file)
     json_data = {"parameterSets": {}}
-    for param_set in parameters:
-        exported_filename = param_set.get(
-            "exported_filename", f"model_{parameters.index(param_set)+1}"
-        )
+    for i, param_set in enumerate(parameters):
+        exported_filename = param_set.get("exported_filename", f"model_{i+1}")
         # Remove exported_filename from the parameters
         params = {k: v for k, v in param_set.items() if k != "exported_filename"}
         # Attempt to convert "true"/"false" to booleans
@@ -527,9 +729,25 @@ def csv_to_json(csv_file, json_file):
         json_data["parameterSets"][exported_filename] = params
     # Add fileFormatVersion
     json_data["fileFormatVersion"] = "1"
-    # Write to JSON file
-    with open(json_file, "w") as jf:
-        json.dump(json_data, jf, indent=4)
+    # Write to JSON file, using orjson when available. orjson writes non-finite
+    # floats as null, so those files go through the stdlib json module instead.
+    encoded = None
+    if orjson is not None and not any(
+        isinstance(v, float) and not math.isfinite(v)
+        for params in json_data["parameterSets"].values()
+        for v in params.values()
+    ):
+        try:
+            encoded = orjson.dumps(json_data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles these
+    if encoded is not None:
+        with open(json_file, "wb") as jf:
+            jf.write(encoded)
+    else:
+        # Same layout as orjson: two-space indentation, UTF-8 without escaping
+        with open(json_file, "w", encoding="utf-8") as jf:
+            json.dump(json_data, jf, indent=2, ensure_ascii=False)
     print(f"Converted {csv_file} to {json_file}.")
 
 
@@ -547,20 +765,22 @@ def json_to_csv(json_file, csv_file):
     for params in parameter_sets:
         all_keys.update(params.keys())
     # Ensure 'exported_filename' is first column
-    fieldnames = ["exported_filename"] + sorted(all_keys - {"exported_filename"})
+    other_keys = tuple(sorted(all_keys - {"exported_filename"}))
+    fieldnames = ("exported_filename",) + other_keys
+    rows = []
+    for param_set in parameter_sets:
+        row = [param_set.get("exported_filename", "model")]
+        for key in other_keys:
+            value = param_set.get(key, "")
+            # Convert booleans to "true"/"false" strings
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            row.append(value)
+        rows.append(row)
     with open(csv_file, "w", newline="") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for param_set in parameter_sets:
-            row = {"exported_filename": param_set.get("exported_filename", "model")}
-            for key in all_keys - {"exported_filename"}:
-                value = param_set.get(key, "")
-                # Convert booleans to "true"/"false" strings
-                if isinstance(value, bool):
-                    row[key] = "true" if value else "false"
-                else:
-                    row[key] = value
-            writer.writerow(row)
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
     print(f"Converted {json_file} to {csv_file}.")
 
 
@@ -570,6 +790,14 @@ def main():
     """
     args = parse_arguments()
 
+    if getattr(args, "verbose", False):
+        # Configure only this module's logger, so other libraries' debug output
+        # (e.g. asyncio) stays hidden
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+
     if args.command == "export":
         batch_export(
             args.scad_file,